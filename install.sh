@@ -18,9 +18,9 @@ fi
 # Install system dependencies (for audio)
 echo "Installing system dependencies..."
 if command -v apt &> /dev/null; then
-    sudo apt install -y portaudio19-dev python3-pyaudio libsndfile1 2>/dev/null || true
+    sudo apt install -y portaudio19-dev python3-pyaudio libsndfile1 ffmpeg 2>/dev/null || true
 elif command -v dnf &> /dev/null; then
-    sudo dnf install -y portaudio-devel python3-pyaudio libsndfile 2>/dev/null || true
+    sudo dnf install -y portaudio-devel python3-pyaudio libsndfile ffmpeg-free 2>/dev/null || true
 fi
 
 # Create virtual environment
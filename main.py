@@ -1,27 +1,29 @@
 #!/usr/bin/env python3
 
+import io
 import os
 import sys
+import queue
+import wave
 import shutil
-import tempfile
-import threading
 import subprocess
-import signal
-from datetime import datetime
+import threading
 
 import json
 import time
+import hashlib
 
-import httpx
+import orjson
+import diskcache
+import sounddevice as sd
 from dotenv import load_dotenv
-from pynput import keyboard
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QTextEdit, QSystemTrayIcon, QMenu
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject
-from PyQt6.QtGui import QIcon, QAction, QFont
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QObject, QRunnable, QThreadPool, QMimeData
+from PyQt6.QtGui import QIcon, QAction, QFont, QTextCursor, QClipboard
 
 load_dotenv()
 
@@ -31,116 +33,275 @@ LLM_MODEL = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
 DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY", "")
 DEEPGRAM_MODEL = os.getenv("DEEPGRAM_MODEL", "nova-2")
 
-TOGGLE_HOTKEY = {keyboard.Key.cmd, keyboard.KeyCode.from_char('h')}
+CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "voice-transcriber"
+)
+CACHE_EXPIRE = 7 * 86400
+
+CLEANUP_SYSTEM_PROMPT = """Your goal is to take user prompt, which has been transcribed from a voice recording, and clean up the structure if the flow is disjointed,or has too much repetition. Make sure you don't lose any information in the process, everything that was mentioned must end up in the final text, even it its reorganized for clarity. But don't add extra information either, your goal is just to make it more clear. Keep a fairly conversational tone, don't expend on the text by giving example or making plans or anything beyond what the initial recording states."""
+
+TOGGLE_HOTKEY = '<cmd>+h'
+
+# Recording state is toggled via the "recording" dynamic property
+WINDOW_STYLESHEET = """
+QLabel#timerLabel { color: #666; }
+QLabel#timerLabel[recording="true"] { color: #ff4444; }
+QPushButton#recordButton[recording="true"] { background-color: #ff4444; color: white; }
+"""
 
 
 class SignalBridge(QObject):
     recording_started = pyqtSignal()
-    recording_stopped = pyqtSignal(str)
+    recording_stopped = pyqtSignal()
     transcription_done = pyqtSignal(str)
     transcript_interim = pyqtSignal(str)
+    cleanup_chunk = pyqtSignal(str)
     cleanup_done = pyqtSignal(str)
+    cleanup_failed = pyqtSignal(str, str)
     error_occurred = pyqtSignal(str)
     status_update = pyqtSignal(str)
     hotkey_toggle = pyqtSignal()
 
 
 class AudioRecorder:
-    RECORDERS = [
-        ("pw-record", ["--format=s16", "--rate=16000", "--channels=1"]),
-        ("parecord", ["--format=s16le", "--rate=16000", "--channels=1", "--file-format=wav"]),
-        ("arecord", ["-f", "S16_LE", "-r", "16000", "-c", "1", "-t", "wav"]),
-    ]
+    SAMPLE_RATE = 16000
+    CHANNELS = 1
+    BLOCKSIZE = 3200  # 200 ms of audio per callback
+    SILENCE_RMS_THRESHOLD = 50
 
     def __init__(self):
         self.recording = False
-        self.process = None
-        self.output_file = None
-        self.recorder_cmd = self._detect_recorder()
-
-    def _detect_recorder(self):
-        for cmd, args in self.RECORDERS:
-            if shutil.which(cmd):
-                return (cmd, args)
-        return None
-
-    def start(self):
-        if not self.recorder_cmd:
-            raise RuntimeError("No audio recorder found. Install pw-record, parecord, or arecord.")
+        self.stream = None
+        self.audio_queue = None
+        self.digest = None
+        self._buf = None
+        self._wav = None
+        self._hasher = None
+
+    def start(self, audio_queue: queue.Queue = None):
+        if self.stream is not None:
+            raise RuntimeError("Already recording")
+        buf = io.BytesIO()
+        wav = wave.open(buf, "wb")
+        wav.setnchannels(self.CHANNELS)
+        wav.setsampwidth(2)
+        wav.setframerate(self.SAMPLE_RATE)
+        hasher = hashlib.blake2b(digest_size=16)
+        try:
+            stream = sd.RawInputStream(
+                samplerate=self.SAMPLE_RATE,
+                channels=self.CHANNELS,
+                dtype="int16",
+                blocksize=self.BLOCKSIZE,
+                callback=self._make_callback(wav, hasher, audio_queue)
+            )
+            stream.start()
+        except Exception:
+            wav.close()
+            raise
+        self.stream = stream
+        self.audio_queue = audio_queue
+        self.digest = None
+        self._buf = buf
+        self._wav = wav
+        self._hasher = hasher
         self.recording = True
-        self.output_file = tempfile.NamedTemporaryFile(
-            suffix=".wav", delete=False, prefix="voice_"
-        )
-        self.output_file.close()
-        cmd, args = self.recorder_cmd
-        self.process = subprocess.Popen(
-            [cmd] + args + [self.output_file.name],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
 
-    def stop(self) -> str:
-        self.recording = False
-        if self.process:
-            self.process.send_signal(signal.SIGINT)
-            try:
-                self.process.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                self.process.kill()
-                self.process.wait()
-            self.process = None
-        if self.output_file and os.path.exists(self.output_file.name):
-            if os.path.getsize(self.output_file.name) > 44:
-                return self.output_file.name
-            else:
-                os.unlink(self.output_file.name)
-        return ""
+    @staticmethod
+    def _make_callback(wav, hasher, audio_queue):
+        # Bound to this recording's writers so a later start() can't redirect it
+        def callback(indata, frames, time_info, status):
+            data = bytes(indata)
+            wav.writeframesraw(data)
+            hasher.update(data)
+            if audio_queue is not None:
+                audio_queue.put(data)
+        return callback
+
+    def stop(self):
+        """Stop capturing and return the WAV as a BytesIO, or None if nothing was captured."""
+        # Detach this recording's state before blocking so start() can't be clobbered
+        stream, self.stream = self.stream, None
+        audio_queue, self.audio_queue = self.audio_queue, None
+        wav, self._wav = self._wav, None
+        hasher, self._hasher = self._hasher, None
+        buf, self._buf = self._buf, None
+        if stream:
+            stream.stop()
+            stream.close()
+        if audio_queue is not None:
+            # Tell the live streamer no more audio is coming
+            audio_queue.put(None)
+        if wav:
+            wav.close()
+        if hasher:
+            self.digest = hasher.hexdigest()
+        if self.stream is None:
+            self.recording = False
+        if buf is not None and buf.getbuffer().nbytes > 44:
+            buf.seek(0)
+            return buf
+        return None
+
+    def is_silent(self, buf: io.BytesIO) -> bool:
+        import numpy as np
+        pcm = np.frombuffer(buf.getbuffer(), dtype=np.int16, offset=44)
+        rms = np.sqrt(np.mean(pcm.astype(np.float32) ** 2))
+        return rms < self.SILENCE_RMS_THRESHOLD
 
 
 class GroqAPI:
+    MODELS_URL = "https://api.groq.com/openai/v1/models"
+    TRANSCRIBE_URL = "https://api.groq.com/openai/v1/audio/transcriptions"
+    CHAT_URL = "https://api.groq.com/openai/v1/chat/completions"
+    ENCODE_TIMEOUT = 30.0
+    _TRANSCRIBE_DATA = {"model": WHISPER_MODEL}
+    _JSON_HEADERS = {"Content-Type": "application/json"}
+    _SYSTEM_MESSAGE = {"role": "system", "content": CLEANUP_SYSTEM_PROMPT}
+    _SYSTEM_PROMPT_HASH = hashlib.blake2b(
+        CLEANUP_SYSTEM_PROMPT.encode("utf-8"), digest_size=16
+    ).hexdigest()
+    _CLEANUP_PAYLOAD = {
+        "model": LLM_MODEL,
+        "max_tokens": 2000,
+        "temperature": 0.7,
+        "stream": True
+    }
+
     def __init__(self, api_key: str):
         self.api_key = api_key
-        self.client = httpx.Client(timeout=120.0)
-
-    def transcribe(self, audio_path: str) -> str:
-        url = "https://api.groq.com/openai/v1/audio/transcriptions"
-        with open(audio_path, "rb") as f:
-            files = {"file": ("audio.wav", f, "audio/wav")}
-            data = {"model": WHISPER_MODEL}
-            headers = {"Authorization": f"Bearer {self.api_key}"}
-            response = self.client.post(url, files=files, data=data, headers=headers)
-            response.raise_for_status()
-            result = response.json()
-            return result.get("text", "")
-
-    def cleanup(self, text: str) -> str:
-        url = "https://api.groq.com/openai/v1/chat/completions"
-        system_prompt = """Your goal is to take user prompt, which has been transcribed from a voice recording, and clean up the structure if the flow is disjointed,or has too much repetition. Make sure you don't lose any information in the process, everything that was mentioned must end up in the final text, even it its reorganized for clarity. But don't add extra information either, your goal is just to make it more clear. Keep a fairly conversational tone, don't expend on the text by giving example or making plans or anything beyond what the initial recording states."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        self._client = None
+        self._client_lock = threading.Lock()
+        self.cache = diskcache.Cache(CACHE_DIR)
+        self.ffmpeg = shutil.which("ffmpeg")
+
+    @property
+    def client(self):
+        # Created on first use so httpx/h2 are imported off the startup path
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    import httpx
+                    self._client = httpx.Client(
+                        timeout=120.0,
+                        http2=True,
+                        limits=httpx.Limits(
+                            max_keepalive_connections=4,
+                            max_connections=10,
+                            keepalive_expiry=75.0
+                        ),
+                        headers={"Authorization": f"Bearer {self.api_key}"}
+                    )
+        return self._client
+
+    @staticmethod
+    def _hash_text(text: str) -> str:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def clear_cache(self):
+        self.cache.clear()
+
+    def warm_up(self):
+        """Open a pooled connection so the next request skips the TLS handshake."""
+        try:
+            self.client.get(self.MODELS_URL)
+        except Exception:
+            pass
+
+    def _encode_opus(self, audio: io.BytesIO):
+        """Compress the WAV to Ogg/Opus; returns None if ffmpeg is missing, fails or hangs."""
+        if not self.ffmpeg:
+            return None
+        try:
+            result = subprocess.run(
+                [self.ffmpeg, "-loglevel", "error", "-f", "wav", "-i", "pipe:0",
+                 "-c:a", "libopus", "-b:a", "24k", "-f", "ogg", "pipe:1"],
+                input=audio.getbuffer(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                timeout=self.ENCODE_TIMEOUT
+            )
+        except (subprocess.TimeoutExpired, OSError):
+            return None
+        if result.returncode != 0 or not result.stdout:
+            return None
+        return result.stdout
+
+    def _post_audio(self, file_field: tuple) -> dict:
+        files = {"file": file_field}
+        response = self.client.post(self.TRANSCRIBE_URL, files=files, data=self._TRANSCRIBE_DATA)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def transcribe(self, audio: io.BytesIO, digest: str) -> str:
+        key = ("transcribe", WHISPER_MODEL, digest)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        opus = self._encode_opus(audio)
+        if opus:
+            result = self._post_audio(("audio.ogg", opus, "audio/ogg"))
+        else:
+            result = self._post_audio(("audio.wav", audio, "audio/wav"))
+        text = result.get("text", "")
+        self.cache.set(key, text, expire=CACHE_EXPIRE)
+        return text
+
+    def cleanup(self, text: str, on_chunk=None) -> str:
+        key = ("cleanup", LLM_MODEL, self._SYSTEM_PROMPT_HASH, self._hash_text(text))
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
         payload = {
-            "model": LLM_MODEL,
+            **self._CLEANUP_PAYLOAD,
             "messages": [
-                {"role": "system", "content": system_prompt},
+                self._SYSTEM_MESSAGE,
                 {"role": "user", "content": f"Here is the user prompt: {text}"}
-            ],
-            "max_tokens": 2000,
-            "temperature": 0.7
+            ]
         }
-        response = self.client.post(url, json=payload, headers=headers)
-        response.raise_for_status()
-        result = response.json()
-        return result["choices"][0]["message"]["content"]
+        parts = []
+        finished = False
+        with self.client.stream(
+            "POST", self.CHAT_URL, content=orjson.dumps(payload), headers=self._JSON_HEADERS
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[len("data: "):]
+                if data == "[DONE]":
+                    finished = True
+                    break
+                event = orjson.loads(data)
+                if "error" in event:
+                    error = event["error"]
+                    if isinstance(error, dict):
+                        error = error.get("message", error)
+                    raise RuntimeError(f"Groq stream error: {error}")
+                choices = event.get("choices")
+                if not choices:
+                    continue
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    parts.append(delta)
+                    if on_chunk:
+                        on_chunk(delta)
+                if choices[0].get("finish_reason"):
+                    finished = True
+        if not finished:
+            raise RuntimeError("Cleanup stream ended before completion")
+        cleaned = "".join(parts)
+        if not cleaned:
+            raise RuntimeError("Cleanup returned no text")
+        self.cache.set(key, cleaned, expire=CACHE_EXPIRE)
+        return cleaned
 
 
 class DeepgramStreamer:
     """Streams audio to Deepgram for real-time transcription."""
 
     def __init__(self, api_key: str, model: str, signals: SignalBridge):
-        import websocket as ws_module
-        self._ws_module = ws_module
+        self._ws_module = None
         self.api_key = api_key
         self.model = model
         self.signals = signals
@@ -150,6 +311,8 @@ class DeepgramStreamer:
         self._segments = []
 
     def start(self):
+        import websocket as ws_module
+        self._ws_module = ws_module
         url = (
             f"wss://api.deepgram.com/v1/listen"
             f"?model={self.model}"
@@ -221,6 +384,66 @@ class DeepgramStreamer:
             self.signals.transcript_interim.emit(" ".join(self._segments + [text]))
 
 
+class _TranscribeJob(QRunnable):
+    """Transcribes a finished recording on a pooled thread."""
+
+    def __init__(self, window: "TranscriberWindow", audio: io.BytesIO, digest: str,
+                 deepgram=None, deepgram_thread=None):
+        super().__init__()
+        self.window = window
+        self.audio = audio
+        self.digest = digest
+        self.deepgram = deepgram
+        self.deepgram_thread = deepgram_thread
+
+    def run(self):
+        window = self.window
+        signals = window.signals
+        audio = self.audio
+        digest = self.digest
+        try:
+            if audio is not None and window.recorder.is_silent(audio):
+                audio = None
+            if self.deepgram_thread:
+                self.deepgram_thread.join(timeout=2)  # Let streamer flush queued audio
+            if self.deepgram:
+                final_text = self.deepgram.stop()
+                if final_text:
+                    signals.transcription_done.emit(final_text)
+                elif audio:
+                    # Deepgram produced nothing, fall back to Whisper
+                    signals.status_update.emit("Falling back to Whisper...")
+                    text = window.api.transcribe(audio, digest)
+                    signals.transcription_done.emit(text)
+                else:
+                    signals.status_update.emit("Empty recording — skipped")
+            elif audio:
+                signals.status_update.emit("Transcribing...")
+                text = window.api.transcribe(audio, digest)
+                signals.transcription_done.emit(text)
+            else:
+                signals.status_update.emit("Empty recording — skipped")
+        except Exception as e:
+            signals.error_occurred.emit(f"Error: {e}")
+
+
+class _CleanupJob(QRunnable):
+    """Runs the LLM cleanup of a transcript on a pooled thread."""
+
+    def __init__(self, window: "TranscriberWindow", text: str):
+        super().__init__()
+        self.window = window
+        self.text = text
+
+    def run(self):
+        window = self.window
+        try:
+            cleaned = window.api.cleanup(self.text, on_chunk=window.signals.cleanup_chunk.emit)
+            window.signals.cleanup_done.emit(cleaned)
+        except Exception as e:
+            window.signals.cleanup_failed.emit(f"Cleanup failed: {e}", self.text)
+
+
 class TranscriberWindow(QMainWindow):
     def __init__(self, signals: SignalBridge, tray_app=None):
         super().__init__()
@@ -228,10 +451,12 @@ class TranscriberWindow(QMainWindow):
         self.tray_app = tray_app
         self.recorder = AudioRecorder()
         self.api = GroqAPI(GROQ_API_KEY)
-        self.current_audio_path = ""
-        self.recording_start_time = None
+        self._t0_ns = None
+        self._last_timer_text = "00:00"
+        self._cleanup_streamed = False
         self.deepgram = None
-        self._streaming = False
+        self._deepgram_thread = None
+        self._pool = QThreadPool.globalInstance()
         self.setup_ui()
         self.setup_signals()
         self.setup_timer()
@@ -243,6 +468,7 @@ class TranscriberWindow(QMainWindow):
             Qt.WindowType.WindowStaysOnTopHint |
             Qt.WindowType.Tool
         )
+        self.setStyleSheet(WINDOW_STYLESHEET)
         central = QWidget()
         self.setCentralWidget(central)
         layout = QVBoxLayout(central)
@@ -257,10 +483,11 @@ class TranscriberWindow(QMainWindow):
         self.timer_label = QLabel("00:00")
         self.timer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.timer_label.setFont(QFont("monospace", 24, QFont.Weight.Bold))
-        self.timer_label.setStyleSheet("color: #666;")
+        self.timer_label.setObjectName("timerLabel")
         layout.addWidget(self.timer_label)
 
         self.record_btn = QPushButton("Start Recording")
+        self.record_btn.setObjectName("recordButton")
         self.record_btn.setMinimumHeight(50)
         self.record_btn.setFont(QFont("sans-serif", 12))
         self.record_btn.clicked.connect(self.toggle_recording)
@@ -298,7 +525,9 @@ class TranscriberWindow(QMainWindow):
         self.signals.recording_stopped.connect(self.on_recording_stopped)
         self.signals.transcription_done.connect(self.on_transcription_done)
         self.signals.transcript_interim.connect(self.on_transcript_interim)
+        self.signals.cleanup_chunk.connect(self.on_cleanup_chunk)
         self.signals.cleanup_done.connect(self.on_cleanup_done)
+        self.signals.cleanup_failed.connect(self.on_cleanup_failed)
         self.signals.error_occurred.connect(self.on_error)
         self.signals.status_update.connect(self.update_status)
         self.signals.hotkey_toggle.connect(self.toggle_recording)
@@ -315,108 +544,88 @@ class TranscriberWindow(QMainWindow):
 
     def start_recording(self):
         try:
+            audio_queue = queue.Queue() if DEEPGRAM_API_KEY else None
+            self.recorder.start(audio_queue)
             self.text_edit.clear()
-            self.recorder.start()
-            self.recording_start_time = datetime.now()
-            self.timer.start(100)
+            self._t0_ns = time.monotonic_ns()
+            self.timer_label.setText("00:00")
+            self._last_timer_text = "00:00"
+            self.timer.start(500)
             self.signals.recording_started.emit()
-            if DEEPGRAM_API_KEY:
-                threading.Thread(target=self._start_deepgram_streaming, daemon=True).start()
+            threading.Thread(target=self.api.warm_up, daemon=True).start()
+            if audio_queue is not None:
+                self.deepgram = DeepgramStreamer(DEEPGRAM_API_KEY, DEEPGRAM_MODEL, self.signals)
+                self._deepgram_thread = threading.Thread(
+                    target=self._start_deepgram_streaming,
+                    args=(self.deepgram, audio_queue),
+                    daemon=True
+                )
+                self._deepgram_thread.start()
         except Exception as e:
             self.signals.error_occurred.emit(f"Failed to start recording: {e}")
 
-    def _start_deepgram_streaming(self):
-        """Background thread: connect to Deepgram and stream audio from the growing WAV file."""
+    def _start_deepgram_streaming(self, streamer: DeepgramStreamer, audio_queue: queue.Queue):
+        """Background thread: connect to Deepgram and forward captured audio as it arrives."""
         try:
-            self.deepgram = DeepgramStreamer(DEEPGRAM_API_KEY, DEEPGRAM_MODEL, self.signals)
-            self.deepgram.start()
-            self._streaming = True
+            streamer.start()
             self.signals.status_update.emit("Recording (live transcription)...")
         except Exception as e:
-            self.deepgram = None
-            self._streaming = False
             self.signals.status_update.emit("Live transcription unavailable")
+            # Keep draining so the queue doesn't grow for the rest of the recording
+            while audio_queue.get() is not None:
+                pass
             return
 
-        file_path = self.recorder.output_file.name
-        time.sleep(0.2)
-        try:
-            with open(file_path, 'rb') as f:
-                # Skip WAV header (44 bytes)
-                header = b''
-                while len(header) < 44 and self._streaming:
-                    chunk = f.read(44 - len(header))
-                    if chunk:
-                        header += chunk
-                    else:
-                        time.sleep(0.05)
-                # Stream PCM data as it's written by the recorder
-                while self._streaming:
-                    chunk = f.read(4096)
-                    if chunk:
-                        self.deepgram.send_audio(chunk)
-                    else:
-                        time.sleep(0.05)
-                # Flush any remaining data after recording stops
-                while True:
-                    chunk = f.read(4096)
-                    if not chunk:
-                        break
-                    self.deepgram.send_audio(chunk)
-        except Exception:
-            pass
+        # Audio captured while connecting is already queued; None marks the end
+        while True:
+            chunk = audio_queue.get()
+            if chunk is None:
+                break
+            streamer.send_audio(chunk)
 
     def stop_recording(self):
         self.timer.stop()
-        self._streaming = False
-        def do_stop():
-            try:
-                audio_path = self.recorder.stop()
-                self.signals.recording_stopped.emit(audio_path)
-                if self.deepgram:
-                    time.sleep(0.5)  # Let file streamer flush remaining audio
-                    final_text = self.deepgram.stop()
-                    self.deepgram = None
-                    if final_text:
-                        self.signals.transcription_done.emit(final_text)
-                    elif audio_path:
-                        # Deepgram produced nothing, fall back to Whisper
-                        self.signals.status_update.emit("Falling back to Whisper...")
-                        text = self.api.transcribe(audio_path)
-                        self.signals.transcription_done.emit(text)
-                elif audio_path:
-                    self.signals.status_update.emit("Transcribing...")
-                    text = self.api.transcribe(audio_path)
-                    self.signals.transcription_done.emit(text)
-                if audio_path:
-                    try:
-                        os.unlink(audio_path)
-                    except Exception:
-                        pass
-            except Exception as e:
-                self.signals.error_occurred.emit(f"Error: {e}")
-        threading.Thread(target=do_stop, daemon=True).start()
+        # Stop the microphone right away; only the network work waits for a pool slot
+        try:
+            audio = self.recorder.stop()
+        except Exception as e:
+            self.signals.error_occurred.emit(f"Error: {e}")
+            return
+        self.signals.recording_stopped.emit()
+        # Hand this session's streamer to the job so a new recording can't swap it out
+        deepgram, self.deepgram = self.deepgram, None
+        deepgram_thread, self._deepgram_thread = self._deepgram_thread, None
+        self._pool.start(_TranscribeJob(
+            self, audio, self.recorder.digest, deepgram, deepgram_thread
+        ))
 
     def update_timer(self):
-        if self.recording_start_time:
-            elapsed = datetime.now() - self.recording_start_time
-            minutes = int(elapsed.total_seconds() // 60)
-            seconds = int(elapsed.total_seconds() % 60)
-            self.timer_label.setText(f"{minutes:02d}:{seconds:02d}")
+        if self._t0_ns is not None:
+            elapsed_s = (time.monotonic_ns() - self._t0_ns) // 1_000_000_000
+            minutes, seconds = divmod(elapsed_s, 60)
+            text = f"{minutes:02d}:{seconds:02d}"
+            if text != self._last_timer_text:
+                self.timer_label.setText(text)
+                self._last_timer_text = text
+
+    def _set_recording_style(self, recording: bool):
+        # Re-polish so the cached stylesheet re-evaluates the property selector
+        for widget in (self.record_btn, self.timer_label):
+            widget.setProperty("recording", recording)
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
 
     def on_recording_started(self):
         self.record_btn.setText("Stop Recording")
-        self.record_btn.setStyleSheet("background-color: #ff4444; color: white;")
+        self._set_recording_style(True)
         self.status_label.setText("Recording...")
-        self.timer_label.setStyleSheet("color: #ff4444;")
         self.show()
         self.activateWindow()
         self.raise_()
 
-    def on_recording_stopped(self, audio_path: str):
+    def on_recording_stopped(self):
         self.record_btn.setText("Start Recording")
-        self.record_btn.setStyleSheet("")
-        self.timer_label.setStyleSheet("color: #666;")
+        self._set_recording_style(False)
 
     def on_transcription_done(self, text: str):
         self.text_edit.setText(text)
@@ -424,31 +633,54 @@ class TranscriberWindow(QMainWindow):
         self.cleanup_btn.setEnabled(bool(text))
         # Auto-copy to clipboard if enabled
         if text and self.tray_app and self.tray_app.auto_copy_enabled:
-            QApplication.clipboard().setText(text)
-            self.status_label.setText("Transcription complete (copied to clipboard)")
+            self._copy_to_clipboard(text, "Transcription complete (copied to clipboard)")
         else:
             self.status_label.setText("Transcription complete")
 
     def on_transcript_interim(self, text: str):
         self.text_edit.setText(text)
 
+    def on_cleanup_chunk(self, text: str):
+        if not self._cleanup_streamed:
+            self._cleanup_streamed = True
+            self.text_edit.clear()
+        cursor = self.text_edit.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+
     def on_cleanup_done(self, text: str):
-        self.text_edit.setText(text)
+        if self.text_edit.toPlainText() != text:
+            self.text_edit.setText(text)
         self.status_label.setText("Text cleaned up")
+        self.cleanup_btn.setEnabled(True)
+
+    def on_cleanup_failed(self, message: str, original: str):
+        # A partial stream may have replaced the transcript; put it back
+        if self._cleanup_streamed:
+            self._cleanup_streamed = False
+            self.text_edit.setText(original)
+        self.on_error(message)
+        self.cleanup_btn.setEnabled(True)
 
     def on_error(self, message: str):
         self.status_label.setText(f"Error: {message}")
         self.record_btn.setText("Start Recording")
-        self.record_btn.setStyleSheet("")
+        self._set_recording_style(False)
 
     def update_status(self, message: str):
         self.status_label.setText(message)
 
+    def _copy_to_clipboard(self, text: str, status: str):
+        mime = QMimeData()
+        mime.setText(text)
+        QApplication.clipboard().setMimeData(mime, QClipboard.Mode.Clipboard)
+        # Repaint the status after the clipboard ownership handshake returns
+        QTimer.singleShot(0, lambda: self.status_label.setText(status))
+
     def copy_text(self):
         text = self.text_edit.toPlainText()
         if text:
-            QApplication.clipboard().setText(text)
-            self.status_label.setText("Copied to clipboard")
+            self._copy_to_clipboard(text, "Copied to clipboard")
 
     def cleanup_text(self):
         text = self.text_edit.toPlainText()
@@ -456,21 +688,15 @@ class TranscriberWindow(QMainWindow):
             return
         self.cleanup_btn.setEnabled(False)
         self.status_label.setText("Cleaning up...")
-        def do_cleanup():
-            try:
-                cleaned = self.api.cleanup(text)
-                self.signals.cleanup_done.emit(cleaned)
-            except Exception as e:
-                self.signals.error_occurred.emit(f"Cleanup failed: {e}")
-            finally:
-                self.cleanup_btn.setEnabled(True)
-        threading.Thread(target=do_cleanup, daemon=True).start()
+        self._cleanup_streamed = False
+        self._pool.start(_CleanupJob(self, text))
 
     def clear_text(self):
         self.text_edit.clear()
         self.copy_btn.setEnabled(False)
         self.cleanup_btn.setEnabled(False)
         self.timer_label.setText("00:00")
+        self._last_timer_text = "00:00"
         self.status_label.setText("Ready - Press Win+H to record")
 
 
@@ -478,72 +704,19 @@ class GlobalHotkeyListener:
     def __init__(self, signals: SignalBridge, window: TranscriberWindow):
         self.signals = signals
         self.window = window
-        self.current_keys = set()
         self.listener = None
-        self.hotkey_fired = False
 
     def start(self):
-        self.listener = keyboard.Listener(
-            on_press=self.on_press,
-            on_release=self.on_release
-        )
+        from pynput import keyboard
+        self.listener = keyboard.GlobalHotKeys({
+            TOGGLE_HOTKEY: self.signals.hotkey_toggle.emit
+        })
         self.listener.start()
 
     def stop(self):
         if self.listener:
             self.listener.stop()
 
-    def on_press(self, key):
-        try:
-            if hasattr(key, 'char') and key.char:
-                self.current_keys.add(keyboard.KeyCode.from_char(key.char.lower()))
-            else:
-                self.current_keys.add(key)
-        except:
-            self.current_keys.add(key)
-        if self._check_hotkey(TOGGLE_HOTKEY):
-            if not self.hotkey_fired:
-                self.hotkey_fired = True
-                self.signals.hotkey_toggle.emit()
-
-    def on_release(self, key):
-        try:
-            if hasattr(key, 'char') and key.char:
-                self.current_keys.discard(keyboard.KeyCode.from_char(key.char.lower()))
-            else:
-                self.current_keys.discard(key)
-        except:
-            pass
-        if not self._check_hotkey(TOGGLE_HOTKEY):
-            self.hotkey_fired = False
-
-    def _check_hotkey(self, target_keys: set) -> bool:
-        normalized = set()
-        for k in self.current_keys:
-            if isinstance(k, keyboard.KeyCode):
-                normalized.add(k)
-            elif k in (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r, keyboard.Key.ctrl):
-                normalized.add(keyboard.Key.ctrl_l)
-            elif k in (keyboard.Key.shift_l, keyboard.Key.shift_r, keyboard.Key.shift):
-                normalized.add(keyboard.Key.shift)
-            elif k in (keyboard.Key.cmd_l, keyboard.Key.cmd_r, keyboard.Key.cmd):
-                normalized.add(keyboard.Key.cmd)
-            else:
-                normalized.add(k)
-        target_normalized = set()
-        for k in target_keys:
-            if isinstance(k, keyboard.KeyCode):
-                target_normalized.add(k)
-            elif k in (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r, keyboard.Key.ctrl):
-                target_normalized.add(keyboard.Key.ctrl_l)
-            elif k in (keyboard.Key.shift_l, keyboard.Key.shift_r, keyboard.Key.shift):
-                target_normalized.add(keyboard.Key.shift)
-            elif k in (keyboard.Key.cmd_l, keyboard.Key.cmd_r, keyboard.Key.cmd):
-                target_normalized.add(keyboard.Key.cmd)
-            else:
-                target_normalized.add(k)
-        return target_normalized.issubset(normalized)
-
 
 class SystemTrayApp:
     def __init__(self, app: QApplication, window: TranscriberWindow, signals: SignalBridge):
@@ -558,26 +731,26 @@ class SystemTrayApp:
         self.setup_tray()
         self.setup_signals()
 
-    def setup_icons(self):
+    @staticmethod
+    def _dot_icon(color: str) -> QIcon:
         from PyQt6.QtGui import QPixmap, QPainter, QColor
-        # Normal icon (green)
         pixmap = QPixmap(32, 32)
         pixmap.fill(Qt.GlobalColor.transparent)
         painter = QPainter(pixmap)
-        painter.setBrush(QColor("#4CAF50"))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(4, 4, 24, 24)
-        painter.end()
-        self.normal_icon = QIcon(pixmap)
-        # Recording icon (red)
-        pixmap_red = QPixmap(32, 32)
-        pixmap_red.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap_red)
-        painter.setBrush(QColor("#ff4444"))
+        painter.setBrush(QColor(color))
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawEllipse(4, 4, 24, 24)
         painter.end()
-        self.recording_icon = QIcon(pixmap_red)
+        return QIcon(pixmap)
+
+    def setup_icons(self):
+        # Prefer theme icons; only paint the fallback dots if the theme lacks them
+        self.normal_icon = QIcon.fromTheme("audio-input-microphone")
+        if self.normal_icon.isNull():
+            self.normal_icon = self._dot_icon("#4CAF50")
+        self.recording_icon = QIcon.fromTheme("media-record")
+        if self.recording_icon.isNull():
+            self.recording_icon = self._dot_icon("#ff4444")
 
     def setup_signals(self):
         self.signals.recording_started.connect(self.on_recording_started)
@@ -600,6 +773,9 @@ class SystemTrayApp:
         self.auto_copy_action.setChecked(self.auto_copy_enabled)
         self.auto_copy_action.triggered.connect(self.toggle_auto_copy)
         menu.addAction(self.auto_copy_action)
+        clear_cache_action = QAction("Clear Cache", menu)
+        clear_cache_action.triggered.connect(self.clear_cache)
+        menu.addAction(clear_cache_action)
         menu.addSeparator()
         quit_action = QAction("Quit", menu)
         quit_action.triggered.connect(self.quit_app)
@@ -611,11 +787,15 @@ class SystemTrayApp:
     def toggle_auto_copy(self):
         self.auto_copy_enabled = self.auto_copy_action.isChecked()
 
+    def clear_cache(self):
+        self.window.api.clear_cache()
+        self.signals.status_update.emit("Cache cleared")
+
     def on_recording_started(self):
         self.tray.setIcon(self.recording_icon)
         self.tray.setToolTip("Voice Transcriber - Recording...")
 
-    def on_recording_stopped(self, audio_path: str = ""):
+    def on_recording_stopped(self):
         self.tray.setIcon(self.normal_icon)
         self.tray.setToolTip("Voice Transcriber")
 